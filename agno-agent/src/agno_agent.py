@@ -1,15 +1,69 @@
+import os
+import sqlite3
+
 from agno.agent import Agent
 from agno.db.sqlite import SqliteDb
 from agno.models.anthropic import Claude
 from agno.os import AgentOS
 from agno.tools.mcp import MCPTools
+from anthropic import DEFAULT_CONNECTION_LIMITS, AsyncAnthropic, DefaultAsyncHttpxClient
+from sqlalchemy import event
+from sqlalchemy.pool import ConnectionPoolEntry
+
+# Create the database shared by every Agent in this process
+db = SqliteDb(db_file="agno.db")
+
+
+@event.listens_for(db.db_engine, "connect")
+def _set_sqlite_pragmas(
+    dbapi_connection: sqlite3.Connection, connection_record: ConnectionPoolEntry
+) -> None:
+    # WAL lets session reads proceed while another run is writing
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # With WAL, NORMAL only syncs at checkpoints instead of on every commit
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # 256 MiB of memory-mapped I/O and a 64 MiB page cache per connection
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+# Create the async Anthropic client used by every Claude run in this process.
+# Set ANTHROPIC_MAX_CONNECTIONS to cap concurrent Claude requests per worker
+# process (the total budget is workers x cap); extra runs then queue for a
+# pooled connection for up to the SDK's 600 s pool timeout.
+anthropic_max_connections = os.getenv("ANTHROPIC_MAX_CONNECTIONS")
+anthropic_client = AsyncAnthropic(
+    http_client=DefaultAsyncHttpxClient(
+        # Build on the SDK's own Limits class and default pool sizes
+        limits=type(DEFAULT_CONNECTION_LIMITS)(
+            max_connections=(
+                int(anthropic_max_connections)
+                if anthropic_max_connections
+                else DEFAULT_CONNECTION_LIMITS.max_connections
+            ),
+            max_keepalive_connections=(
+                DEFAULT_CONNECTION_LIMITS.max_keepalive_connections
+            ),
+            # Keep idle connections around between runs to skip TCP/TLS setup
+            keepalive_expiry=60,
+        ),
+    ),
+)
 
 # Create the Agent
 agno_agent = Agent(
     name="Agno Agent",
-    model=Claude(id="claude-sonnet-4-0"),
+    model=Claude(
+        id="claude-sonnet-4-0",
+        async_client=anthropic_client,
+        # Mark the static system prompt as cacheable across runs
+        cache_system_prompt=True,
+    ),
     # Add a database to the Agent
-    db=SqliteDb(db_file="agno.db"),
+    db=db,
     # Add the Agno MCP server to the Agent
     tools=[
         MCPTools(
@@ -27,3 +81,15 @@ agno_agent = Agent(
 agent_os = AgentOS(agents=[agno_agent])
 # Get the FastAPI app for the AgentOS
 app = agent_os.get_app()
+
+if __name__ == "__main__":
+    # Serve on the C-implemented event loop and HTTP parser in a single process;
+    # see `make agno-agent-workers` for multi-worker serving
+    agent_os.serve(
+        app="agno_agent:app",
+        # uvicorn picks uvloop when it is installed and asyncio otherwise
+        loop="auto",
+        http="httptools",
+        # Skip the per-request access log line
+        access_log=False,
+    )
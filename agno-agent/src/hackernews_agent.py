@@ -7,6 +7,8 @@ agent = Agent(
     tools=[HackerNewsTools()],
     markdown=True,
 )
-agent.print_response(
-    "Summarize the top 5 stories on hackernews", stream=True
-)
+
+if __name__ == "__main__":
+    agent.print_response(
+        "Summarize the top 5 stories on hackernews", stream=True
+    )